@@ -16,10 +16,13 @@ Notes
 
 from __future__ import annotations
 import argparse
+import functools
 import itertools
+import multiprocessing
 from datetime import datetime
 import sys
-from typing import List, Set, Dict
+from types import MappingProxyType
+from typing import FrozenSet, Iterator, List, Mapping, NamedTuple, Optional, Set, Dict, Union
 
 # Optional dependency: zxcvbn for richer password scoring
 try:
@@ -33,42 +36,115 @@ try:
 except Exception:
     nltk = None
 
+# Optional dependency: pybloom_live for low-memory dedup on very large wordlists
+try:
+    from pybloom_live import ScalableBloomFilter  # pip package name: pybloom-live
+except Exception:
+    ScalableBloomFilter = None
+
+# Optional dependency: pyroaring for compact hash-based dedup bitmaps
+try:
+    from pyroaring import BitMap64  # pip package name: pyroaring
+except Exception:
+    BitMap64 = None
+
+# Optional dependency: numba to JIT-compile the fallback character scan
+try:
+    from numba import njit  # pip package name: numba
+except Exception:
+    njit = None
+
 # --------------------------
 # Password analysis section
 # --------------------------
 
-def analyze_password(password: str) -> Dict:
+# Bitmask flags for character classes found in a password
+_HAS_LOWER, _HAS_UPPER, _HAS_DIGIT, _HAS_SYMBOL = 1, 2, 4, 8
+
+if njit:
+    @njit(cache=True)
+    def _classify(pw_bytes: bytes) -> int:
+        """Single native-code pass returning a bitmask of character classes."""
+        mask = 0
+        for c in pw_bytes:
+            if 97 <= c <= 122:
+                mask |= 1
+            elif 65 <= c <= 90:
+                mask |= 2
+            elif 48 <= c <= 57:
+                mask |= 4
+            else:
+                mask |= 8
+        return mask
+else:
+    _classify = None
+
+if zxcvbn:
+    # zxcvbn does dictionary scans costing tens of ms per call; cache repeats
+    _zxcvbn_cached = functools.lru_cache(maxsize=4096)(zxcvbn)
+else:
+    _zxcvbn_cached = None
+
+# Read-only empty mapping shared by results that have no crack-time data;
+# a mutable {} default would be one dict shared across every fallback result
+_EMPTY_MAPPING: Mapping = MappingProxyType({})
+
+class PasswordAnalysis(NamedTuple):
+    """
+    Result of analyze_password: a compact tuple (no per-result dict and no
+    per-key string storage when analyzing large batches).
+    """
+    score: Optional[int]
+    entropy: float
+    feedback: Union[Dict, str]
+    crack_times_display: Mapping = _EMPTY_MAPPING
+
+def analyze_password(password: str) -> PasswordAnalysis:
     """
     Analyze password strength.
-    Returns a dict with keys: score (0-4 or None), entropy (float), feedback (dict or text).
+    Returns a PasswordAnalysis with score (0-4 or None), entropy (float),
+    feedback (dict or text) and, from zxcvbn, crack_times_display.
     If zxcvbn is available, its output is returned (trimmed). Otherwise a fallback estimate used.
     """
     if not password:
-        return {"score": None, "entropy": 0.0, "feedback": "No password provided."}
+        return PasswordAnalysis(None, 0.0, "No password provided.")
 
     if zxcvbn:
         try:
-            res = zxcvbn(password)
-            return {
-                "score": res.get("score"),
-                "entropy": res.get("entropy"),
-                "feedback": res.get("feedback", {}),
-                "crack_times_display": res.get("crack_times_display", {}),
-            }
+            res = _zxcvbn_cached(password)
+            return PasswordAnalysis(
+                score=res.get("score"),
+                entropy=res.get("entropy"),
+                feedback=res.get("feedback", {}),
+                crack_times_display=res.get("crack_times_display", {}),
+            )
         except Exception:
             # If zxcvbn fails for any reason, fall through to fallback estimator
             pass
 
-    # Fallback entropy estimate (crude)
-    pool = 0
-    if any(c.islower() for c in password):
-        pool += 26
-    if any(c.isupper() for c in password):
-        pool += 26
-    if any(c.isdigit() for c in password):
-        pool += 10
-    if any(not c.isalnum() for c in password):
-        pool += 32  # rough estimate for symbol set
+    # Fallback entropy estimate (crude). The njit kernel classifies raw bytes,
+    # which only matches the Unicode-aware per-char loop for ASCII input, so
+    # non-ASCII passwords always take the pure-Python path.
+    if _classify and password.isascii():
+        mask = _classify(password.encode("ascii"))
+    else:
+        # Single pass accumulating a class bitmask instead of four any() scans
+        mask = 0
+        for c in password:
+            if c.islower():
+                mask |= _HAS_LOWER
+            elif c.isupper():
+                mask |= _HAS_UPPER
+            elif c.isdigit():
+                mask |= _HAS_DIGIT
+            elif not c.isalnum():
+                mask |= _HAS_SYMBOL
+            if mask == 15:
+                break
+    pool = (26 * ((mask & _HAS_LOWER) != 0)
+            + 26 * ((mask & _HAS_UPPER) != 0)
+            + 10 * ((mask & _HAS_DIGIT) != 0)
+            + 32 * ((mask & _HAS_SYMBOL) != 0))  # rough estimate for symbol set
 
     # Use log2(pool) * length approx -> bits; but use bit_length() of pool for simplicity
     bits_per_char = pool.bit_length() if pool else 0
@@ -84,7 +160,25 @@ def analyze_password(password: str) -> Dict:
     else:
         score = 4
 
-    return {"score": score, "entropy": entropy, "feedback": {"warning": "Fallback estimator used."}}
+    return PasswordAnalysis(score, entropy, {"warning": "Fallback estimator used."})
+
+# Minimum distinct passwords before a batch is farmed out to worker processes
+_PARALLEL_THRESHOLD = 256
+
+def analyze_passwords(passwords: List[str]) -> List[PasswordAnalysis]:
+    """
+    Analyze a batch of passwords, computing each distinct password only once.
+    Large batches are spread over a multiprocessing.Pool since the per-password
+    analysis (zxcvbn dictionary matching) is CPU-bound.
+    Returns results in the same order as the input list.
+    """
+    uniq = list(set(passwords))
+    if len(uniq) >= _PARALLEL_THRESHOLD:
+        with multiprocessing.Pool() as pool:
+            results = dict(zip(uniq, pool.map(analyze_password, uniq, chunksize=64)))
+    else:
+        results = {p: analyze_password(p) for p in uniq}
+    return [results[p] for p in passwords]
 
 # --------------------------
 # Wordlist generation logic
@@ -102,40 +196,84 @@ LEET_MAP = {
     "t": ["7"],
 }
 
-def leet_variations(token: str, max_subs: int = 2) -> Set[str]:
+# LEET_MAP flattened into a table indexed by ord(char): empty tuple means no
+# substitutions, so lookups are a single C-level list index instead of a dict probe
+_LEET_TABLE: List[tuple] = [()] * 256
+for _ch, _subs in LEET_MAP.items():
+    _LEET_TABLE[ord(_ch)] = tuple(_subs)
+
+def leet_variations(token: str, max_subs: int = 2) -> FrozenSet[str]:
     """
     Generate leetspeak variants for a token.
     max_subs: limit number of positions substituted at once to control explosion.
-    Returns a set including the original token.
+    Returns a frozenset including the original token.
     """
     token = token.strip()
     if not token:
-        return set()
-
+        return frozenset()
+    return _leet_variations_cached(token, max_subs)
+
+@functools.lru_cache(maxsize=2048)
+def _leet_variations_cached(token: str, max_subs: int,
+                            _table=_LEET_TABLE,
+                            _combinations=itertools.combinations,
+                            _product=itertools.product) -> frozenset:
+    """
+    Memoized worker for leet_variations; token is already stripped.
+    The lru_cache key includes max_subs, so each substitution depth gets its
+    own specialized result set; the table and itertools helpers are bound as
+    default arguments at definition time so the hot loop reads locals instead
+    of doing global lookups.
+    """
     variants = {token}
     lower = token.lower()
-    positions = [i for i, ch in enumerate(lower) if ch in LEET_MAP]
-
-    # Generate combinations of substitution positions (1..max_subs)
+    positions = [i for i, ch in enumerate(lower) if ord(ch) < 256 and _table[ord(ch)]]
+
+    # Hand-unrolled body for the default max_subs == 2: one slice loop for
+    # single substitutions and two nested position loops for pairs, with no
+    # range/combinations/product machinery on the hot path.
+    if max_subs == 2:
+        for i, p in enumerate(positions):
+            head, tail = token[:p], token[p + 1:]
+            subs_p = _table[ord(lower[p])]
+            for c in subs_p:
+                variants.add(head + c + tail)
+            for q in positions[i + 1:]:
+                mid, q_tail = token[p + 1:q], token[q + 1:]
+                subs_q = _table[ord(lower[q])]
+                for cp in subs_p:
+                    left = head + cp + mid
+                    for cq in subs_q:
+                        variants.add(left + cq + q_tail)
+        return frozenset(variants)
+
+    token_chars = list(token)
+
+    # For each subset of substitutable positions, take the cartesian product of
+    # the mapped chars per position. Single substitutions (the bulk of the
+    # output) are built with C-level slice concatenation; only multi-position
+    # combinations fall back to patching a list buffer.
     for r in range(1, min(max_subs, len(positions)) + 1):
-        for comb in itertools.combinations(positions, r):
-            # Build iterative substitution sequences to try all mapped chars per position
-            seqs = [list(token)]
-            for pos in comb:
-                new_seqs = []
-                for seq in seqs:
-                    ch = seq[pos].lower()
-                    subs = LEET_MAP.get(ch, [])
-                    for s in subs:
-                        new_seq = seq.copy()
-                        new_seq[pos] = s
-                        new_seqs.append(new_seq)
-                if new_seqs:
-                    seqs = new_seqs
-            for seq in seqs:
-                variants.add("".join(seq))
-
-    return variants
+        if r == 1:
+            for p in positions:
+                head, tail = token[:p], token[p + 1:]
+                for c in _table[ord(lower[p])]:
+                    variants.add(head + c + tail)
+            continue
+        for comb in _combinations(positions, r):
+            choices = [_table[ord(lower[p])] for p in comb]
+            for picks in _product(*choices):
+                buf = token_chars[:]
+                for p, c in zip(comb, picks):
+                    buf[p] = c
+                variants.add("".join(buf))
+
+    return frozenset(variants)
+
+@functools.lru_cache(maxsize=None)
+def _year_strings(current: int, years_back: int) -> tuple:
+    """Year suffixes as strings, computed once per (current year, span)."""
+    return tuple(str(y) for y in range(current - years_back + 1, current + 1))
 
 def append_recent_years(token: str, years_back: int = 10) -> Set[str]:
     """
@@ -145,58 +283,173 @@ def append_recent_years(token: str, years_back: int = 10) -> Set[str]:
     token = token.strip()
     if not token:
         return set()
-    current = datetime.now().year
-    years = {str(y) for y in range(current - years_back + 1, current + 1)}
+    years = _year_strings(datetime.now().year, years_back)
     return {token + y for y in years}
 
+# Threshold above which a compact structure (if installed) replaces the dedup set
+_BLOOM_THRESHOLD = 1_000_000
+
+class _HashedDedup:
+    """
+    Dedup on 64-bit string hashes stored in a roaring bitmap: a few bytes per
+    entry versus ~50+ bytes per live str object in a set. A hash collision can
+    drop the odd legitimate candidate, which is fine for wordlist output.
+    """
+    __slots__ = ("_bits",)
+
+    def __init__(self):
+        self._bits = BitMap64()
+
+    def __contains__(self, word: str) -> bool:
+        return (hash(word) & 0xFFFFFFFFFFFFFFFF) in self._bits
+
+    def add(self, word: str) -> None:
+        self._bits.add(hash(word) & 0xFFFFFFFFFFFFFFFF)
+
+# Suffixes appended to every emitted base word
+_COMMON_SUFFIXES = ("123", "!", "@", "2020", "2021", "2022")
+
+def iter_wordlist(tokens: List[str],
+                  max_words: int = 50000,
+                  append_years_flag: bool = True,
+                  include_common_suffixes: bool = True) -> Iterator[str]:
+    """
+    Yield candidate words based on tokens, deduplicated, up to max_words.
+    - tokens: list of user-provided tokens (names, pets, dates, etc.)
+    - max_words: cap to avoid huge outputs
+
+    Candidates are streamed so callers can write them straight to disk;
+    only the dedup structure stays in memory: a set capped at max_words, or
+    for very large caps a roaring bitmap of hashes (pyroaring) or a Bloom
+    filter (pybloom_live) when those packages are installed.
+    """
+    if max_words <= 0:
+        return
+
+    clean_tokens = [t.strip() for t in tokens if t and t.strip()]
+
+    # CPython sets cannot reserve capacity up front, and seeding a set with
+    # dummy keys to pre-grow its table benchmarks slower than just letting it
+    # resize; growth rehashes are amortized and bounded by max_words anyway.
+    if max_words > _BLOOM_THRESHOLD and BitMap64:
+        seen = _HashedDedup()
+    elif max_words > _BLOOM_THRESHOLD and ScalableBloomFilter:
+        seen = ScalableBloomFilter(mode=ScalableBloomFilter.SMALL_SET_GROWTH)
+    else:
+        seen: Set[str] = set()
+
+    def _candidates() -> Iterator[str]:
+        # Basic case variants + leet + years; case variants are only emitted
+        # when they actually differ (digit-only or single-case tokens produce
+        # fewer candidate strings)
+        for t in clean_tokens:
+            yield t
+            lower_t = t.lower()
+            if lower_t != t:
+                yield lower_t
+            upper_t = t.upper()
+            if upper_t != t:
+                yield upper_t
+            cap_t = t.capitalize()
+            if cap_t != t and cap_t != upper_t:
+                yield cap_t
+
+            # Leet variants (lowercased copy only when it actually differs).
+            # Sorted so truncation at max_words is reproducible across runs:
+            # the per-token sets are tiny, and frozenset iteration order is
+            # hash-randomized.
+            for v in sorted(leet_variations(t)):
+                yield v
+                lv = v.lower()
+                if lv != v:
+                    yield lv
+
+            # Append years, iterating the ordered tuple directly rather than
+            # the set built by append_recent_years
+            if append_years_flag:
+                for y in _year_strings(datetime.now().year, 10):
+                    v = t + y
+                    yield v
+                    lv = v.lower()
+                    if lv != v:
+                        yield lv
+
+        # Pairwise combinations (order matters, like permutations). The stage
+        # is quadratic but lazy: the max_words stop in the consuming loop
+        # bounds it, so no separate token cap is needed. The underscored
+        # prefix is built once per outer token.
+        n = len(clean_tokens)
+        for i in range(n):
+            a = clean_tokens[i]
+            a_us = a + "_"
+            for j in range(n):
+                if j == i:
+                    continue
+                b = clean_tokens[j]
+                yield a + b
+                yield a_us + b
+
+    common_suffixes = _COMMON_SUFFIXES if include_common_suffixes else ()
+
+    count = 0
+    for base in _candidates():
+        if base not in seen:
+            seen.add(base)
+            yield base
+            count += 1
+            if count >= max_words:
+                return
+        # Emit suffixed variants right after each base so no snapshot of the
+        # growing output is ever materialized; map() keeps the concat loop in C.
+        # This runs even when the base was a duplicate: a word can show up first
+        # as another base's suffix variant and still owe its own expansion here
+        # (e.g. alice2020 arriving as alice+"2020" before the year variant).
+        for w in map(base.__add__, common_suffixes):
+            if w in seen:
+                continue
+            seen.add(w)
+            yield w
+            count += 1
+            if count >= max_words:
+                return
+
+# Number of candidate lines buffered before each join-and-write
+_WRITE_CHUNK = 8192
+
+def write_wordlist(path: str, words: Iterator[str]) -> int:
+    """
+    Write candidate words to path, one per line, and return how many were written.
+    Lines are buffered and flushed with a single join per chunk instead of one
+    fh.write call per word.
+    """
+    count = 0
+    buf: List[str] = []
+    with open(path, "w", encoding="utf-8") as fh:
+        for w in words:
+            buf.append(w)
+            count += 1
+            if len(buf) >= _WRITE_CHUNK:
+                fh.write("\n".join(buf) + "\n")
+                buf.clear()
+        if buf:
+            fh.write("\n".join(buf) + "\n")
+    return count
+
 def generate_wordlist(tokens: List[str],
                       max_words: int = 50000,
                       append_years_flag: bool = True,
                       include_common_suffixes: bool = True) -> List[str]:
     """
-    Generate a deterministic sorted list of candidate words based on tokens.
-    - tokens: list of user-provided tokens (names, pets, dates, etc.)
-    - max_words: cap to avoid huge outputs
+    Convenience wrapper around iter_wordlist: collect the (already capped)
+    stream and sort only the truncated result for deterministic output.
     """
-    clean_tokens = [t.strip() for t in tokens if t and t.strip()]
-    results: Set[str] = set()
-
-    # Basic case variants + leet + years
-    for t in clean_tokens:
-        results.add(t)
-        results.add(t.lower())
-        results.add(t.upper())
-        results.add(t.capitalize())
-
-        # Leet variants
-        for v in leet_variations(t):
-            results.add(v)
-            results.add(v.lower())
-
-        # Append years
-        if append_years_flag:
-            for v in append_recent_years(t):
-                results.add(v)
-                results.add(v.lower())
-
-    # Pairwise combinations (order matters: permutations)
-    for a, b in itertools.permutations(clean_tokens, 2):
-        results.add(a + b)
-        results.add(a + "_" + b)
-
-    # Add common suffixes to snapshot (avoid iterating over growing set)
-    if include_common_suffixes:
-        common_suffixes = ["123", "!", "@", "2020", "2021", "2022"]
-        snapshot = list(results)  # snapshot to extend from
-        for base in snapshot:
-            for s in common_suffixes:
-                results.add(base + s)
-
-    # Limit size deterministically
-    if len(results) > max_words:
-        results = set(sorted(results)[:max_words])
-
-    return sorted(results)
+    words = list(iter_wordlist(tokens, max_words=max_words,
+                               append_years_flag=append_years_flag,
+                               include_common_suffixes=include_common_suffixes))
+    # The generator (and its dedup structure) is exhausted and freed by now,
+    # so the in-place sort runs without the set still resident
+    words.sort()
+    return words
 
 # --------------------------
 # CLI + GUI launcher
@@ -205,6 +458,7 @@ def generate_wordlist(tokens: List[str],
 def cli_main():
     parser = argparse.ArgumentParser(description="Password Strength Analyzer & Custom Wordlist Generator")
     parser.add_argument("--password", "-p", help="Password to analyze (optional).")
+    parser.add_argument("--passwords-file", help="File with one password per line to analyze in batch (optional).")
     parser.add_argument("--inputs", "-i", help="Comma-separated tokens (example: 'Alice,Fluffy,1990')", default="")
     parser.add_argument("--output", "-o", help="Output wordlist file (default: custom_wordlist.txt)", default="custom_wordlist.txt")
     parser.add_argument("--no-years", dest="years", action="store_false", help="Do not append recent years to tokens.")
@@ -222,9 +476,9 @@ def cli_main():
     if args.password:
         info = analyze_password(args.password)
         print("Password analysis:")
-        print(f"  Score (0-4): {info.get('score')}")
-        print(f"  Entropy: {info.get('entropy')}")
-        feedback = info.get('feedback')
+        print(f"  Score (0-4): {info.score}")
+        print(f"  Entropy: {info.entropy}")
+        feedback = info.feedback
         if feedback:
             print("  Feedback:")
             if isinstance(feedback, dict):
@@ -234,16 +488,30 @@ def cli_main():
                 print(f"    - {feedback}")
         print()
 
+    # Batch analysis: stream the file in chunks so huge lists stay cheap
+    if args.passwords_file:
+        with open(args.passwords_file, "r", encoding="utf-8") as fh:
+            chunk: List[str] = []
+            for line in fh:
+                pw = line.rstrip("\n")
+                if not pw:
+                    continue
+                chunk.append(pw)
+                if len(chunk) >= 1000:
+                    for p, info in zip(chunk, analyze_passwords(chunk)):
+                        print(f"{p}\tscore={info.score}\tentropy={info.entropy}")
+                    chunk = []
+            for p, info in zip(chunk, analyze_passwords(chunk)):
+                print(f"{p}\tscore={info.score}\tentropy={info.entropy}")
+        print()
+
     if not tokens:
         print("No input tokens provided. Use --inputs 'Alice,Fluffy,1990' to provide tokens for generation.")
         return
 
-    wordlist = generate_wordlist(tokens, max_words=args.max_words, append_years_flag=args.years)
-    with open(args.output, "w", encoding="utf-8") as fh:
-        for w in wordlist:
-            fh.write(w + "\n")
-
-    print(f"Generated {len(wordlist)} words and saved to: {args.output}")
+    count = write_wordlist(args.output,
+                           iter_wordlist(tokens, max_words=args.max_words, append_years_flag=args.years))
+    print(f"Generated {count} words and saved to: {args.output}")
 
 # --------------------------
 # Optional Tkinter GUI
@@ -282,16 +550,13 @@ def launch_gui():
         out = out_entry.get().strip() or "custom_wordlist.txt"
         if pw:
             info = analyze_password(pw)
-            messagebox.showinfo("Password Analysis", f"Score: {info.get('score')}\nEntropy: {info.get('entropy')}")
+            messagebox.showinfo("Password Analysis", f"Score: {info.score}\nEntropy: {info.entropy}")
         if not tokens:
             messagebox.showwarning("No tokens", "Please provide at least one token to generate the wordlist.")
             return
-        wl = generate_wordlist(tokens)
         try:
-            with open(out, "w", encoding="utf-8") as fh:
-                for w in wl:
-                    fh.write(w + "\n")
-            messagebox.showinfo("Done", f"Saved {len(wl)} words to {out}")
+            count = write_wordlist(out, iter_wordlist(tokens))
+            messagebox.showinfo("Done", f"Saved {count} words to {out}")
         except Exception as e:
             messagebox.showerror("Error", str(e))
 